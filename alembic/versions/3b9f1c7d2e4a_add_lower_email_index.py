@@ -0,0 +1,37 @@
+"""add lower(email) index on users
+
+Revision ID: 3b9f1c7d2e4a
+Revises: 600e62b59ce4
+Create Date: 2026-10-15 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b9f1c7d2e4a'
+down_revision: Union[str, Sequence[str], None] = '600e62b59ce4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Deliberately NOT unique: existing rows may differ only by case, and this
+    # migration must not fail on them. Case-insensitive uniqueness of new
+    # emails is enforced only by the application-level pre-check in
+    # POST /auth/register (get_user_by_email), not by the database.
+    op.create_index(
+        'ix_users_email_lower',
+        'users',
+        [sa.text('lower(email)')],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_users_email_lower', table_name='users')
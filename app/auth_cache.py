@@ -0,0 +1,96 @@
+"""
+auth_cache.py - In-Process Cache of Verified JWTs
+==================================================
+
+Verifying a JWT signature is the most expensive step of every authenticated
+request. Clients reuse the same token for its whole lifetime, so we keep the
+decoded payload of recently verified tokens in memory and skip the signature
+check when the same token comes back.
+
+HOW IT WORKS:
+-------------
+- Key: SHA-256 digest of the raw token string (we never keep tokens themselves)
+- Value: whatever verify_token decoded (read-only payload and parsed user UUID)
+- Each entry lives until min(token "exp", now + TTL cap), so a cache hit can
+  never outlive the token, and revocation-style changes are picked up within
+  a few seconds at most (bounded staleness)
+- Least-recently-used entries are evicted once the cache is full
+- Only SUCCESSFUL verifications are stored - failures are never cached
+
+THREAD SAFETY:
+--------------
+verify_token can be called from the event loop and from sync code running in
+FastAPI's threadpool, so all access goes through a threading.Lock.
+"""
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Optional
+import hashlib
+import time
+
+
+class TokenCache:
+    """
+    Bounded LRU cache with per-entry expiration.
+
+    Usage:
+        cache = TokenCache(max_size=10_000, ttl_seconds=5)
+        payload = cache.get(token)
+        if payload is None:
+            payload = jwt.decode(...)
+            cache.put(token, payload, payload["exp"])
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: int):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        # digest -> (value, expires_at); order = least to most recently used
+        self._entries: OrderedDict[bytes, tuple[Any, float]] = OrderedDict()
+        self._lock = Lock()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        """Hash the token so raw credentials never sit in memory as keys."""
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> Optional[Any]:
+        """
+        Return the cached value for a token, or None on miss/expiry.
+        """
+        key = self._key(token)
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= now:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, token: str, value: Any, exp: float) -> None:
+        """
+        Store a verified value until min(exp, now + ttl_seconds).
+
+        Args:
+            token: The raw JWT string
+            value: The decoded data to return on later hits
+            exp: The token's own expiration (Unix timestamp)
+        """
+        if self.max_size <= 0 or self.ttl_seconds <= 0:
+            return
+        key = self._key(token)
+        expires_at = min(exp, time.time() + self.ttl_seconds)
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        with self._lock:
+            self._entries.clear()
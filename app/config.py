@@ -27,8 +27,15 @@ EQUIVALENT MANUAL CODE (what Pydantic does under the hood):
 """
 
 from functools import lru_cache
+from typing import Optional
 import base64
 
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric.ed25519 import (
+    Ed25519PrivateKey,
+    Ed25519PublicKey,
+)
+from pydantic import PrivateAttr, model_validator
 from pydantic_settings import BaseSettings
 
 
@@ -49,12 +56,18 @@ class Settings(BaseSettings):
     # DATABASE
     # =========================================================================
     database_url: str  # Required, no default - app won't start without it
+    db_pool_size: int = 20  # Connections kept open in the pool
+    db_max_overflow: int = 40  # Extra connections allowed under bursts
+    db_pool_recycle: int = 1800  # Seconds before a connection is replaced
+    log_sql: bool = False  # Echo every SQL statement (slow, debugging only)
     
     # =========================================================================
     # SECURITY
     # =========================================================================
     secret_key: str  # For other cryptographic operations (sessions, etc.)
     access_token_expire_minutes: int = 1440  # Default: 24 hours
+    token_cache_ttl_seconds: int = 5  # Max age of a cached verified JWT (0 = off)
+    token_cache_max_size: int = 10000  # Max verified JWTs kept in memory
     
     # =========================================================================
     # ENVIRONMENT
@@ -63,7 +76,7 @@ class Settings(BaseSettings):
     debug: bool = False
     
     # =========================================================================
-    # RSA KEYS FOR JWT (RS256)
+    # ED25519 KEYS FOR JWT (EdDSA)
     # =========================================================================
     # Keys are stored as base64 because:
     # - PEM files contain newlines (\n)
@@ -72,29 +85,76 @@ class Settings(BaseSettings):
     private_key_base64: str = ""
     public_key_base64: str = ""
     
+    # Generate a key pair with:
+    #   openssl genpkey -algorithm ed25519 -out private.pem
+    #   openssl pkey -in private.pem -pubout -out public.pem
+    #   base64 -w0 private.pem   # -> PRIVATE_KEY_BASE64
+    #   base64 -w0 public.pem    # -> PUBLIC_KEY_BASE64
+    #
+    # Key objects, loaded ONCE when Settings is created (see _load_keys).
+    # PEM parsing is not free: it must never run per request, so there is no
+    # lazy decode path that a caller could accidentally hit in a loop.
+    _private_key: Optional[Ed25519PrivateKey] = PrivateAttr(default=None)
+    _public_key: Optional[Ed25519PublicKey] = PrivateAttr(default=None)
+    
+    @model_validator(mode="after")
+    def _load_keys(self) -> "Settings":
+        """
+        Decode both keys from base64 and load them as Ed25519 key objects.
+        
+        Runs once at startup. Keys that are not configured are left unset
+        (e.g. Alembic doesn't need them); invalid keys fail immediately.
+        """
+        # cryptography raises TypeError for password-protected keys and
+        # ValueError for malformed PEM: both become one clear ValueError,
+        # which Pydantic reports as a ValidationError at startup.
+        if self.private_key_base64:
+            pem = base64.b64decode(self.private_key_base64)
+            try:
+                key = serialization.load_pem_private_key(pem, password=None)
+            except (TypeError, ValueError):
+                key = None
+            if not isinstance(key, Ed25519PrivateKey):
+                raise ValueError(
+                    "PRIVATE_KEY_BASE64 must be an unencrypted Ed25519 PEM key!"
+                )
+            self._private_key = key
+        if self.public_key_base64:
+            pem = base64.b64decode(self.public_key_base64)
+            try:
+                key = serialization.load_pem_public_key(pem)
+            except (TypeError, ValueError):
+                key = None
+            if not isinstance(key, Ed25519PublicKey):
+                raise ValueError(
+                    "PUBLIC_KEY_BASE64 must be an unencrypted Ed25519 PEM key!"
+                )
+            self._public_key = key
+        return self
+    
     @property
-    def private_key(self) -> str:
+    def private_key(self) -> Ed25519PrivateKey:
         """
-        Decode private key from base64 to PEM format.
+        The Ed25519 private key object (loaded at startup).
         
         Used by auth.py to SIGN JWT tokens.
         This key must NEVER be shared or exposed!
         """
-        if not self.private_key_base64:
+        if self._private_key is None:
             raise ValueError("PRIVATE_KEY_BASE64 not configured!")
-        return base64.b64decode(self.private_key_base64).decode("utf-8")
+        return self._private_key
     
     @property
-    def public_key(self) -> str:
+    def public_key(self) -> Ed25519PublicKey:
         """
-        Decode public key from base64 to PEM format.
+        The Ed25519 public key object (loaded at startup).
         
         Used by auth.py to VERIFY JWT tokens.
         This key can be shared publicly - it can only verify, not create tokens.
         """
-        if not self.public_key_base64:
+        if self._public_key is None:
             raise ValueError("PUBLIC_KEY_BASE64 not configured!")
-        return base64.b64decode(self.public_key_base64).decode("utf-8")
+        return self._public_key
 
     # Pydantic-settings configuration
     model_config = {
@@ -30,12 +30,15 @@ COLUMN OPTIONS:
 - nullable=False: This field is required (NOT NULL in SQL)
 - index=True: Creates a database index for faster queries
 - default=...: Default value if not provided
+
+Indexes that aren't tied to a single column option (e.g. on an expression
+like lower(email)) go in __table_args__.
 """
 
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import String, Boolean, DateTime, Uuid
+from sqlalchemy import String, Boolean, DateTime, Index, Uuid, func
 from sqlalchemy.orm import mapped_column, Mapped
 
 from app.database import Base
@@ -70,7 +73,7 @@ class User(Base):
     )
     
     # Password hash - NEVER store plain text passwords!
-    # This stores the bcrypt hash from passlib
+    # This stores the bcrypt hash (see services/user_service.py)
     hashed_password: Mapped[str] = mapped_column(
         String(255), 
         nullable=False
@@ -86,4 +89,11 @@ class User(Base):
     created_at: Mapped[datetime] = mapped_column(
         DateTime, 
         default=lambda: datetime.now(timezone.utc)  # Always use UTC!
-    )
\ No newline at end of file
+    )
+    
+    # Case-insensitive email lookup (login): WHERE lower(email) = ...
+    # Not unique: existing rows may differ only by case. Case-insensitive
+    # uniqueness of NEW emails is enforced only by the registration pre-check.
+    __table_args__ = (
+        Index("ix_users_email_lower", func.lower(email)),
+    )
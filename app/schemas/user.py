@@ -28,6 +28,11 @@ import re
 from pydantic import BaseModel, EmailStr, SecretStr, field_validator
 
 
+# Password strength checks, compiled once at import time
+_HAS_DIGIT = re.compile(r"[0-9]").search
+_HAS_UPPER = re.compile(r"[A-Z]").search
+
+
 # =============================================================================
 # INPUT SCHEMAS (what the API receives)
 # =============================================================================
@@ -64,9 +69,9 @@ class UserCreate(BaseModel):
         
         if len(pw) < 8:
             raise ValueError("The password must be at least 8 characters long")
-        if not re.search(r"[0-9]", pw):
+        if not _HAS_DIGIT(pw):
             raise ValueError("The password must include at least a number")
-        if not re.search(r"[A-Z]", pw):
+        if not _HAS_UPPER(pw):
             raise ValueError("The password must include at least a capital letter")
         
         return v
@@ -114,7 +119,7 @@ class Token(BaseModel):
     
     Example response:
         {
-            "access_token": "eyJhbGciOiJSUzI1NiIs...",
+            "access_token": "eyJhbGciOiJFZERTQSIs...",
             "token_type": "bearer"
         }
     """
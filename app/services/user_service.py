@@ -21,16 +21,21 @@ WHY SEPARATE SERVICES?
 
 PASSWORD HASHING:
 -----------------
-We use passlib with bcrypt:
+We use the bcrypt library directly (no passlib wrapper):
 - bcrypt is slow BY DESIGN (prevents brute force attacks)
 - Salt is automatically generated and included in hash
 - Example hash: $2b$12$LQv3c1yqBWVHxkd0LHAkCOYz6TtxMQJqhN8/LewY.5T/V4vN4pHve
+- bcrypt.checkpw compares hashes in constant time (no timing leaks)
+- Hashing takes ~100 ms of CPU, so it runs in FastAPI's threadpool
+  (run_in_threadpool) instead of blocking the event loop for every request
 
 NEVER store plain text passwords!
 """
 
-from passlib.context import CryptContext
-from sqlalchemy.orm import Session
+import bcrypt
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import bindparam, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import User
 from app.schemas import UserCreate
@@ -39,22 +44,54 @@ from app.schemas import UserCreate
 # =============================================================================
 # PASSWORD HASHING CONFIGURATION
 # =============================================================================
-# CryptContext handles password hashing and verification
-# schemes=["bcrypt"]: Use bcrypt algorithm
-# deprecated="auto": Automatically upgrade old hash formats
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Cost factor: 2^12 key-expansion rounds (same as the former passlib default,
+# so existing "$2b$12$..." hashes keep verifying unchanged)
+BCRYPT_ROUNDS = 12
+
+
+def _hash_password(plain_password: str) -> str:
+    """Hash a password with a fresh salt. Blocking: call via the threadpool."""
+    hashed = bcrypt.hashpw(
+        plain_password.encode("utf-8"), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
+    )
+    return hashed.decode("utf-8")
+
+
+def _check_password(plain_password: str, hashed_password: str) -> bool:
+    """Check a password against a stored hash. Blocking: call via the threadpool."""
+    return bcrypt.checkpw(
+        plain_password.encode("utf-8"), hashed_password.encode("utf-8")
+    )
+
+
+# =============================================================================
+# PREBUILT QUERIES
+# =============================================================================
+# Built once at import time. SQLAlchemy caches the compiled SQL per statement,
+# so the login hot path only binds parameters instead of rebuilding a Query.
+# Email matching is case-insensitive and served by the ix_users_email_lower index.
+# Both sides are lowercased by the DATABASE: Python's str.lower() also folds
+# non-ASCII letters ("Ä" -> "ä"), SQL lower() may not (C collation, SQLite).
+# Older rows may differ only by case (e.g. "Alice@x.com" and "alice@x.com"):
+# the row matching the typed email exactly always wins, so both can log in.
+_USER_BY_EMAIL = (
+    select(User)
+    .where(func.lower(User.email) == func.lower(bindparam("email")))
+    .order_by((User.email == bindparam("email_exact")).desc())
+    .limit(1)
+)
 
 
 # =============================================================================
 # USER OPERATIONS
 # =============================================================================
 
-def create_user(db: Session, user_in: UserCreate) -> User:
+async def create_user(db: AsyncSession, user_in: UserCreate) -> User:
     """
     Create a new user in the database.
     
     Args:
-        db: SQLAlchemy database session
+        db: SQLAlchemy async database session
         user_in: Validated user data from request (email + password)
     
     Returns:
@@ -69,16 +106,16 @@ def create_user(db: Session, user_in: UserCreate) -> User:
     
     Example:
         user_data = UserCreate(email="a@b.com", password="Secret123")
-        new_user = create_user(db, user_data)
+        new_user = await create_user(db, user_data)
         # new_user.id is now a UUID
     """
     # Step 1: Extract password from SecretStr wrapper
     # SecretStr.get_secret_value() returns the actual string
     plain_password = user_in.password.get_secret_value()
     
-    # Step 2: Hash password with bcrypt
+    # Step 2: Hash password with bcrypt (in a worker thread, it's slow)
     # This creates a unique salt and combines it with the hash
-    hashed_password = pwd_context.hash(plain_password)
+    hashed_password = await run_in_threadpool(_hash_password, plain_password)
     
     # Step 3: Create User model (NOT schema - this is the DB object)
     db_user = User(
@@ -88,15 +125,15 @@ def create_user(db: Session, user_in: UserCreate) -> User:
     )
     
     # Step 4: Database operations
-    db.add(db_user)      # Add to session (not yet in DB)
-    db.commit()          # Write to database
-    db.refresh(db_user)  # Reload from DB to get generated values (id, created_at)
+    db.add(db_user)            # Add to session (not yet in DB)
+    await db.commit()          # Write to database
+    await db.refresh(db_user)  # Reload from DB to get generated values (id, created_at)
     
     # Step 5: Return the created user
     return db_user
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Verify a plain password against a bcrypt hash.
     
@@ -109,20 +146,28 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     
     Used by: Login endpoint to verify credentials
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    return await run_in_threadpool(
+        _check_password, plain_password, hashed_password
+    )
 
 
-def get_user_by_email(db: Session, email: str) -> User | None:
+async def get_user_by_email(db: AsyncSession, email: str) -> User | None:
     """
     Find a user by their email address.
     
     Args:
-        db: SQLAlchemy database session
+        db: SQLAlchemy async database session
         email: Email address to search for
     
     Returns:
         User if found, None otherwise
     
+    Matching ignores case: "Alice@Example.com" finds "alice@example.com".
+    If several rows differ only by case, the exact match is returned.
+    
     Used by: Login endpoint to find user, registration to check duplicates
     """
-    return db.query(User).filter(User.email == email).first()
\ No newline at end of file
+    result = await db.execute(
+        _USER_BY_EMAIL, {"email": email, "email_exact": email}
+    )
+    return result.scalar_one_or_none()
\ No newline at end of file